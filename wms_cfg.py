@@ -59,6 +59,390 @@ service_cfg = {
     "access_constraints": "",
 }
 
+# Style templates.
+#
+# Styles that differ only in a band name or a mask are built from the shared
+# pieces below rather than spelled out in full.  Within a style set, a style may
+# name an earlier style with "extends" and give only the entries that differ.
+
+
+def band_components(band):
+    """Map a single band onto all three output channels (a greyscale image)."""
+    return {channel: {band: 1.0} for channel in ("red", "green", "blue")}
+
+
+def band_style(band, title, abstract, scaling):
+    """A greyscale style for a single band, named after the band."""
+    return dict(scaling, name=band, title=title, abstract=abstract, components=band_components(band))
+
+
+rgb_components = {
+    "red": {
+        "red": 1.0
+    },
+    "green": {
+        "green": 1.0
+    },
+    "blue": {
+        "blue": 1.0
+    }
+}
+
+# PQ mask showing only pixels that are not cloud.
+cloud_free_mask = [
+    {
+        "flags": {
+            "cloud": False,
+        },
+    },
+]
+
+
+def ndvi(data):
+    return (data["nir"] - data["red"]) / (data["nir"] + data["red"])
+
+
+def ndwi(data):
+    return (data["green"] - data["nir"]) / (data["nir"] + data["green"])
+
+
+def ndbi(data):
+    return (data["swir2"] - data["nir"]) / (data["swir2"] + data["nir"])
+
+
+def expand_styles(styles):
+    """Resolve "extends" entries in a style set.
+
+    A style with "extends" starts from the named (earlier) style in the same set,
+    and its own entries override the inherited ones.  Inherited and shared pieces
+    (components, masks, index functions) are not copied, so styles built from the
+    same pieces share them.
+    """
+    resolved = {}
+    for style in styles:
+        name = style.get("name")
+        if name is None:
+            raise ValueError("Style has no name: %s" % style.get("title", style))
+        if name in resolved:
+            raise ValueError("Duplicate style name %s" % name)
+        style = dict(style)
+        base = style.pop("extends", None)
+        if base is not None:
+            if base not in resolved:
+                raise ValueError("Style %s extends unknown style %s" % (name, base))
+            style = dict(resolved[base], **style)
+        resolved[name] = style
+    return list(resolved.values())
+
+
+# Style sets.
+#
+# See band_mapper.py
+#
+# The various available spectral bands, and ways to combine them
+# into a single rgb image.
+# The examples here are ad hoc
+#
+# LS7:  http://www.indexdatabase.de/db/s-single.php?id=8
+# LS8:  http://www.indexdatabase.de/db/s-single.php?id=168
+
+# The raw band value range to be compressed to an 8 bit range for the output image tiles.
+# Band values outside this range are clipped to 0 or 255 as appropriate.
+landsat_8_scaling = {"scale_range": [ 9500, 22000 ]}
+
+landsat_8_styles = expand_styles([
+    # Examples of styles which are linear combinations of the available spectral bands.
+    #
+    {
+        "name": "simple_rgb",
+        "title": "Simple RGB",
+        "abstract": "Simple true-colour image, using the red, green and blue bands",
+        "components": rgb_components,
+        **landsat_8_scaling,
+    },
+    {
+        "extends": "simple_rgb",
+        "name": "cloud_masked_rgb",
+        "title": "Simple RGB with cloud masking",
+        "abstract": "Simple true-colour image, using the red, green and blue bands, with cloud masking",
+        # PQ masking example
+        "pq_masks": cloud_free_mask,
+    },
+    {
+        "name": "extended_rgb",
+        "title": "Extended RGB",
+        "abstract": "Extended true-colour image, incorporating the coastal aerosol band",
+        "components": {
+            "red": {
+                "red": 1.0
+            },
+            "green": {
+                "green": 1.0
+            },
+            "blue": {
+                "blue": 0.6,
+                "coastal_aerosol": 0.4
+            }
+        },
+        **landsat_8_scaling,
+    },
+    {
+        "name": "wideband",
+        "title": "Wideband false-colour",
+        "abstract": "False-colour image, incorporating all available spectral bands",
+        "components": {
+            "red": {
+                "swir2": 0.255,
+                "swir1": 0.45,
+                "nir": 0.255,
+            },
+            "green": {
+                "nir": 0.255,
+                "red": 0.45,
+                "green": 0.255,
+            },
+            "blue": {
+                "green": 0.255,
+                "blue": 0.45,
+                "coastal_aerosol": 0.255,
+            }
+        },
+        **landsat_8_scaling,
+    },
+    {
+        "name": "infra_red",
+        "title": "False colour multi-band infra-red",
+        "abstract": "Simple false-colour image, using the near and short-wave infra-red bands",
+        "components": {
+            "red": {
+                "swir1": 1.0
+            },
+            "green": {
+                "swir2": 1.0
+            },
+            "blue": {
+                "nir": 1.0
+            }
+        },
+        **landsat_8_scaling,
+    },
+    band_style(
+        "coastal_aerosol",
+        "Spectral band 1 - Coastal aerosol",
+        "Coastal aerosol band, approximately 435nm to 450nm",
+        landsat_8_scaling,
+    ),
+    band_style(
+        "blue",
+        "Spectral band 2 - Blue",
+        "Blue band, approximately 453nm to 511nm",
+        landsat_8_scaling,
+    ),
+    band_style(
+        "green",
+        "Spectral band 3 - Green",
+        "Green band, approximately 534nm to 588nm",
+        landsat_8_scaling,
+    ),
+    band_style(
+        "red",
+        "Spectral band 4 - Red",
+        "Red band, roughly 637nm to 672nm",
+        landsat_8_scaling,
+    ),
+    band_style(
+        "nir",
+        "Spectral band 5 - Near infra-red",
+        "Near infra-red band, roughly 853nm to 876nm",
+        landsat_8_scaling,
+    ),
+    band_style(
+        "swir1",
+        "Spectral band 6 - Short wave infra-red 1",
+        "Short wave infra-red band 1, roughly 1575nm to 1647nm",
+        landsat_8_scaling,
+    ),
+    band_style(
+        "swir2",
+        "Spectral band 7 - Short wave infra-red 2",
+        "Short wave infra-red band 2, roughly 2117nm to 2285nm",
+        landsat_8_scaling,
+    ),
+    #
+    # Examples of non-linear heat-mapped styles.
+    {
+        "name": "ndvi",
+        "title": "NDVI",
+        "abstract": "Normalised Difference Vegetation Index - a derived index that correlates well with the existence of vegetation",
+        "heat_mapped": True,
+        "index_function": ndvi,
+        "needed_bands": ["red", "nir"],
+        # Areas where the index_function returns outside the range are masked.
+        "range": [0.0, 1.0],
+    },
+    {
+        "extends": "ndvi",
+        "name": "ndvi_cloudmask",
+        "title": "NDVI with cloud masking",
+        "abstract": "Normalised Difference Vegetation Index (with cloud masking) - a derived index that correlates well with the existence of vegetation",
+        "pq_masks": cloud_free_mask,
+    },
+    {
+        "name": "ndwi",
+        "title": "NDWI",
+        "abstract": "Normalised Difference Water Index - a derived index that correlates well with the existence of water",
+        "heat_mapped": True,
+        "index_function": ndwi,
+        "needed_bands": ["green", "nir"],
+        "range": [0.0, 1.0],
+    },
+    {
+        "extends": "ndwi",
+        "name": "ndwi_cloudmask",
+        "title": "NDWI with cloud and cloud-shadow masking",
+        "abstract": "Normalised Difference Water Index (with cloud and cloud-shadow masking) - a derived index that correlates well with the existence of water",
+        "pq_masks": cloud_free_mask,
+    },
+    {
+        "name": "ndbi",
+        "title": "NDBI",
+        "abstract": "Normalised Difference Buildup Index - a derived index that correlates with the existence of urbanisation",
+        "heat_mapped": True,
+        "index_function": ndbi,
+        "needed_bands": ["swir2", "nir"],
+        "range": [0.0, 1.0],
+    },
+    # Mask layers - examples of how to display raw pixel quality data.
+    # This works by creatively mis-using the Heatmap style class.
+    {
+        "name": "cloud_mask",
+        "title": "Cloud Mask",
+        "abstract": "Highlight pixels with cloud.",
+        "heat_mapped": True,
+        "index_function": lambda data: data["red"] * 0.0 + 0.1,
+        "needed_bands": ["red"],
+        "range": [0.0, 1.0],
+        # Mask flags normally describe which areas SHOULD be shown.
+        # (i.e. pixels for which any of the declared flags are true)
+        # pq_mask_invert is intended to invert this logic.
+        # (i.e. pixels for which none of the declared flags are true)
+        #
+        # i.e. Specifying like this shows pixels which are not clouds in either metric.
+        #      Specifying "cloud" and setting the "pq_mask_invert" to False would
+        #      show pixels which are not clouds in both metrics.
+        "pq_masks": [
+            {
+                "invert": True,
+                "flags": {
+                    "cloud": False,
+                },
+            },
+        ],
+    },
+    # Hybrid style - mixes a linear mapping and a heat mapped index
+    {
+        "extends": "ndvi",
+        "name": "rgb_ndvi",
+        "title": "NDVI plus RGB",
+        "abstract": "Normalised Difference Vegetation Index (blended with RGB) - a derived index that correlates well with the existence of vegetation",
+        "component_ratio": 0.6,
+        "components": rgb_components,
+        **landsat_8_scaling,
+    },
+    {
+        "extends": "rgb_ndvi",
+        "name": "rgb_ndvi_cloudmask",
+        "title": "NDVI plus RGB (Cloud masked)",
+        "abstract": "Normalised Difference Vegetation Index (blended with RGB and cloud masked) - a derived index that correlates well with the existence of vegetation",
+        "pq_masks": cloud_free_mask,
+    }
+])
+
+landsat_7_scaling = {"scale_factor": 12.0}
+
+landsat_7_styles = expand_styles([
+    {
+        "name": "simple_rgb",
+        "title": "Simple RGB",
+        "abstract": "Simple true-colour image, using the red, green and blue bands",
+        "components": rgb_components,
+        "scale_range": [0.0, 3000.0]
+    },
+    {
+        "name": "wideband",
+        "title": "Wideband false-colour",
+        "abstract": "False-colour image, incorporating all available spectral bands",
+        "components": {
+            "red": {
+                "swir2": 0.5,
+                "swir1": 0.5,
+            },
+            "green": {
+                "nir": 0.5,
+                "red": 0.5,
+            },
+            "blue": {
+                "green": 0.5,
+                "blue": 0.5,
+            }
+        },
+        "scale_range": [0.0, 3000.0]
+    },
+    {
+        "name": "infra_red",
+        "title": "False colour multi-band infra-red",
+        "abstract": "Simple false-colour image, using the near and short-wave infra-red bands",
+        "components": {
+            "red": {
+                "swir1": 1.0
+            },
+            "green": {
+                "swir2": 1.0
+            },
+            "blue": {
+                "nir": 1.0
+            }
+        },
+        **landsat_7_scaling,
+    },
+    band_style(
+        "blue",
+        "Spectral band 1 - Blue",
+        "Blue band, approximately 450nm to 520nm",
+        landsat_7_scaling,
+    ),
+    band_style(
+        "green",
+        "Spectral band 2 - Green",
+        "Green band, approximately 530nm to 610nm",
+        landsat_7_scaling,
+    ),
+    band_style(
+        "red",
+        "Spectral band 3 - Red",
+        "Red band, roughly 630nm to 690nm",
+        landsat_7_scaling,
+    ),
+    band_style(
+        "nir",
+        "Spectral band 4 - Near infra-red",
+        "Near infra-red band, roughly 780nm to 840nm",
+        landsat_7_scaling,
+    ),
+    band_style(
+        "swir1",
+        "Spectral band 5 - Short wave infra-red 1",
+        "Short wave infra-red band 1, roughly 1550nm to 1750nm",
+        landsat_7_scaling,
+    ),
+    band_style(
+        "swir2",
+        "Spectral band 6 - Short wave infra-red 2",
+        "Short wave infra-red band 2, roughly 2090nm to 2220nm",
+        landsat_7_scaling,
+    )
+])
+
 layer_cfg = [
     # Layer Config is a list of platform configs
     {
@@ -129,385 +513,8 @@ layer_cfg = [
                 # E.g. sub-layer 109 will be described as "Landsat Path 109"
                 "sub_product_label": "Landsat Path",
 
-                # Styles.
-                #
-                # See band_mapper.py
-                #
-                # The various available spectral bands, and ways to combine them
-                # into a single rgb image.
-                # The examples here are ad hoc
-                #
-                # LS7:  http://www.indexdatabase.de/db/s-single.php?id=8
-                # LS8:  http://www.indexdatabase.de/db/s-single.php?id=168
-                "styles": [
-                    # Examples of styles which are linear combinations of the available spectral bands.
-                    #
-                    {
-                        "name": "simple_rgb",
-                        "title": "Simple RGB",
-                        "abstract": "Simple true-colour image, using the red, green and blue bands",
-                        "components": {
-                            "red": {
-                                "red": 1.0
-                            },
-                            "green": {
-                                "green": 1.0
-                            },
-                            "blue": {
-                                "blue": 1.0
-                            }
-                        },
-                        # The raw band value range to be compressed to an 8 bit range for the output image tiles.
-                        # Band values outside this range are clipped to 0 or 255 as appropriate.
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "cloud_masked_rgb",
-                        "title": "Simple RGB with cloud masking",
-                        "abstract": "Simple true-colour image, using the red, green and blue bands, with cloud masking",
-                        "components": {
-                            "red": {
-                                "red": 1.0
-                            },
-                            "green": {
-                                "green": 1.0
-                            },
-                            "blue": {
-                                "blue": 1.0
-                            }
-                        },
-                        # PQ masking example
-                        "pq_masks": [
-                            {
-                                "flags": {
-                                    "cloud": False,
-                                },
-                            },
-                        ],
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "extended_rgb",
-                        "title": "Extended RGB",
-                        "abstract": "Extended true-colour image, incorporating the coastal aerosol band",
-                        "components": {
-                            "red": {
-                                "red": 1.0
-                            },
-                            "green": {
-                                "green": 1.0
-                            },
-                            "blue": {
-                                "blue": 0.6,
-                                "coastal_aerosol": 0.4
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "wideband",
-                        "title": "Wideband false-colour",
-                        "abstract": "False-colour image, incorporating all available spectral bands",
-                        "components": {
-                            "red": {
-                                "swir2": 0.255,
-                                "swir1": 0.45,
-                                "nir": 0.255,
-                            },
-                            "green": {
-                                "nir": 0.255,
-                                "red": 0.45,
-                                "green": 0.255,
-                            },
-                            "blue": {
-                                "green": 0.255,
-                                "blue": 0.45,
-                                "coastal_aerosol": 0.255,
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "infra_red",
-                        "title": "False colour multi-band infra-red",
-                        "abstract": "Simple false-colour image, using the near and short-wave infra-red bands",
-                        "components": {
-                            "red": {
-                                "swir1": 1.0
-                            },
-                            "green": {
-                                "swir2": 1.0
-                            },
-                            "blue": {
-                                "nir": 1.0
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "coastal_aerosol",
-                        "title": "Spectral band 1 - Coastal aerosol",
-                        "abstract": "Coastal aerosol band, approximately 435nm to 450nm",
-                        "components": {
-                            "red": {
-                                "coastal_aerosol": 1.0
-                            },
-                            "green": {
-                                "coastal_aerosol": 1.0
-                            },
-                            "blue": {
-                                "coastal_aerosol": 1.0
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "blue",
-                        "title": "Spectral band 2 - Blue",
-                        "abstract": "Blue band, approximately 453nm to 511nm",
-                        "components": {
-                            "red": {
-                                "blue": 1.0
-                            },
-                            "green": {
-                                "blue": 1.0
-                            },
-                            "blue": {
-                                "blue": 1.0
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "green",
-                        "title": "Spectral band 3 - Green",
-                        "abstract": "Green band, approximately 534nm to 588nm",
-                        "components": {
-                            "red": {
-                                "green": 1.0
-                            },
-                            "green": {
-                                "green": 1.0
-                            },
-                            "blue": {
-                                "green": 1.0
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "red",
-                        "title": "Spectral band 4 - Red",
-                        "abstract": "Red band, roughly 637nm to 672nm",
-                        "components": {
-                            "red": {
-                                "red": 1.0
-                            },
-                            "green": {
-                                "red": 1.0
-                            },
-                            "blue": {
-                                "red": 1.0
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "nir",
-                        "title": "Spectral band 5 - Near infra-red",
-                        "abstract": "Near infra-red band, roughly 853nm to 876nm",
-                        "components": {
-                            "red": {
-                                "nir": 1.0
-                            },
-                            "green": {
-                                "nir": 1.0
-                            },
-                            "blue": {
-                                "nir": 1.0
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "swir1",
-                        "title": "Spectral band 6 - Short wave infra-red 1",
-                        "abstract": "Short wave infra-red band 1, roughly 1575nm to 1647nm",
-                        "components": {
-                            "red": {
-                                "swir1": 1.0
-                            },
-                            "green": {
-                                "swir1": 1.0
-                            },
-                            "blue": {
-                                "swir1": 1.0
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "swir2",
-                        "title": "Spectral band 7 - Short wave infra-red 2",
-                        "abstract": "Short wave infra-red band 2, roughly 2117nm to 2285nm",
-                        "components": {
-                            "red": {
-                                "swir2": 1.0
-                            },
-                            "green": {
-                                "swir2": 1.0
-                            },
-                            "blue": {
-                                "swir2": 1.0
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    #
-                    # Examples of non-linear heat-mapped styles.
-                    {
-                        "name": "ndvi",
-                        "title": "NDVI",
-                        "abstract": "Normalised Difference Vegetation Index - a derived index that correlates well with the existence of vegetation",
-                        "heat_mapped": True,
-                        "index_function": lambda data: (data["nir"] - data["red"]) / (data["nir"] + data["red"]),
-                        "needed_bands": ["red", "nir"],
-                        # Areas where the index_function returns outside the range are masked.
-                        "range": [0.0, 1.0],
-                    },
-                    {
-                        "name": "ndvi_cloudmask",
-                        "title": "NDVI with cloud masking",
-                        "abstract": "Normalised Difference Vegetation Index (with cloud masking) - a derived index that correlates well with the existence of vegetation",
-                        "heat_mapped": True,
-                        "index_function": lambda data: (data["nir"] - data["red"]) / (data["nir"] + data["red"]),
-                        "needed_bands": ["red", "nir"],
-                        # Areas where the index_function returns outside the range are masked.
-                        "range": [0.0, 1.0],
-                        "pq_masks": [
-                            {
-                                "flags": {
-                                    "cloud": False,
-                                 },
-                            },
-                        ],
-                    },
-                    {
-                        "name": "ndwi",
-                        "title": "NDWI",
-                        "abstract": "Normalised Difference Water Index - a derived index that correlates well with the existence of water",
-                        "heat_mapped": True,
-                        "index_function": lambda data: (data["green"] - data["nir"]) / (data["nir"] + data["green"]),
-                        "needed_bands": ["green", "nir"],
-                        "range": [0.0, 1.0],
-                    },
-                    {
-                        "name": "ndwi_cloudmask",
-                        "title": "NDWI with cloud and cloud-shadow masking",
-                        "abstract": "Normalised Difference Water Index (with cloud and cloud-shadow masking) - a derived index that correlates well with the existence of water",
-                        "heat_mapped": True,
-                        "index_function": lambda data: (data["green"] - data["nir"]) / (data["nir"] + data["green"]),
-                        "needed_bands": ["green", "nir"],
-                        "range": [0.0, 1.0],
-                        "pq_masks": [
-                            {
-                                "flags": {
-                                    "cloud": False,
-                                },
-                            },
-                        ],
-                    },
-                    {
-                        "name": "ndbi",
-                        "title": "NDBI",
-                        "abstract": "Normalised Difference Buildup Index - a derived index that correlates with the existence of urbanisation",
-                        "heat_mapped": True,
-                        "index_function": lambda data: (data["swir2"] - data["nir"]) / (data["swir2"] + data["nir"]),
-                        "needed_bands": ["swir2", "nir"],
-                        "range": [0.0, 1.0],
-                    },
-                    # Mask layers - examples of how to display raw pixel quality data.
-                    # This works by creatively mis-using the Heatmap style class.
-                    {
-                        "name": "cloud_mask",
-                        "title": "Cloud Mask",
-                        "abstract": "Highlight pixels with cloud.",
-                        "heat_mapped": True,
-                        "index_function": lambda data: data["red"] * 0.0 + 0.1,
-                        "needed_bands": ["red"],
-                        "range": [0.0, 1.0],
-                        # Mask flags normally describe which areas SHOULD be shown.
-                        # (i.e. pixels for which any of the declared flags are true)
-                        # pq_mask_invert is intended to invert this logic.
-                        # (i.e. pixels for which none of the declared flags are true)
-                        #
-                        # i.e. Specifying like this shows pixels which are not clouds in either metric.
-                        #      Specifying "cloud" and setting the "pq_mask_invert" to False would
-                        #      show pixels which are not clouds in both metrics.
-                        "pq_masks": [
-                            {
-                                "invert": True,
-                                "flags": {
-                                    "cloud": False,
-                                },
-                            },
-                        ],
-                    },
-                    # Hybrid style - mixes a linear mapping and a heat mapped index
-                    {
-                        "name": "rgb_ndvi",
-                        "title": "NDVI plus RGB",
-                        "abstract": "Normalised Difference Vegetation Index (blended with RGB) - a derived index that correlates well with the existence of vegetation",
-                        "component_ratio": 0.6,
-                        "heat_mapped": True,
-                        "index_function": lambda data: (data["nir"] - data["red"]) / (data["nir"] + data["red"]),
-                        "needed_bands": ["red", "nir"],
-                        # Areas where the index_function returns outside the range are masked.
-                        "range": [0.0, 1.0],
-                        "components": {
-                            "red": {
-                                "red": 1.0
-                            },
-                            "green": {
-                                "green": 1.0
-                            },
-                            "blue": {
-                                "blue": 1.0
-                            }
-                        },
-                        "scale_range": [ 9500, 22000 ],
-                    },
-                    {
-                        "name": "rgb_ndvi_cloudmask",
-                        "title": "NDVI plus RGB (Cloud masked)",
-                        "abstract": "Normalised Difference Vegetation Index (blended with RGB and cloud masked) - a derived index that correlates well with the existence of vegetation",
-                        "component_ratio": 0.6,
-                        "heat_mapped": True,
-                        "index_function": lambda data: (data["nir"] - data["red"]) / (data["nir"] + data["red"]),
-                        "needed_bands": ["red", "nir"],
-                        # Areas where the index_function returns outside the range are masked.
-                        "range": [0.0, 1.0],
-                        "components": {
-                            "red": {
-                                "red": 1.0
-                            },
-                            "green": {
-                                "green": 1.0
-                            },
-                            "blue": {
-                                "blue": 1.0
-                            }
-                        },
-                        "pq_masks": [
-                            {
-                                "flags": {
-                                    "cloud": False,
-                                },
-                            },
-                        ],
-                        "scale_range": [ 9500, 22000 ],
-                    }
-                ],
+                # Styles (see the style sets above).
+                "styles": landsat_8_styles,
                 # Default style (if request does not specify style)
                 # MUST be defined in the styles list above.
 
@@ -539,163 +546,6 @@ to_be_added_to_layer_cfg = {
             "min_zoom_factor": 500.0
         },
     ],
-    "styles": [
-        {
-            "name": "simple_rgb",
-            "title": "Simple RGB",
-            "abstract": "Simple true-colour image, using the red, green and blue bands",
-            "components": {
-                "red": {
-                    "red": 1.0
-                },
-                "green": {
-                    "green": 1.0
-                },
-                "blue": {
-                    "blue": 1.0
-                }
-            },
-            "scale_range": [0.0, 3000.0]
-        },
-        {
-            "name": "wideband",
-            "title": "Wideband false-colour",
-            "abstract": "False-colour image, incorporating all available spectral bands",
-            "components": {
-                "red": {
-                    "swir2": 0.5,
-                    "swir1": 0.5,
-                },
-                "green": {
-                    "nir": 0.5,
-                    "red": 0.5,
-                },
-                "blue": {
-                    "green": 0.5,
-                    "blue": 0.5,
-                }
-            },
-            "scale_range": [0.0, 3000.0]
-        },
-        {
-            "name": "infra_red",
-            "title": "False colour multi-band infra-red",
-            "abstract": "Simple false-colour image, using the near and short-wave infra-red bands",
-            "components": {
-                "red": {
-                    "swir1": 1.0
-                },
-                "green": {
-                    "swir2": 1.0
-                },
-                "blue": {
-                    "nir": 1.0
-                }
-            },
-            "scale_factor": 12.0
-        },
-        {
-            "name": "blue",
-            "title": "Spectral band 1 - Blue",
-            "abstract": "Blue band, approximately 450nm to 520nm",
-            "components": {
-                "red": {
-                    "blue": 1.0
-                },
-                "green": {
-                    "blue": 1.0
-                },
-                "blue": {
-                    "blue": 1.0
-                }
-            },
-            "scale_factor": 12.0
-        },
-        {
-            "name": "green",
-            "title": "Spectral band 2 - Green",
-            "abstract": "Green band, approximately 530nm to 610nm",
-            "components": {
-                "red": {
-                    "green": 1.0
-                },
-                "green": {
-                    "green": 1.0
-                },
-                "blue": {
-                    "green": 1.0
-                }
-            },
-            "scale_factor": 12.0
-        },
-        {
-            "name": "red",
-            "title": "Spectral band 3 - Red",
-            "abstract": "Red band, roughly 630nm to 690nm",
-            "components": {
-                "red": {
-                    "red": 1.0
-                },
-                "green": {
-                    "red": 1.0
-                },
-                "blue": {
-                    "red": 1.0
-                }
-            },
-            "scale_factor": 12.0
-        },
-        {
-            "name": "nir",
-            "title": "Spectral band 4 - Near infra-red",
-            "abstract": "Near infra-red band, roughly 780nm to 840nm",
-            "components": {
-                "red": {
-                    "nir": 1.0
-                },
-                "green": {
-                    "nir": 1.0
-                },
-                "blue": {
-                    "nir": 1.0
-                }
-            },
-            "scale_factor": 12.0
-        },
-        {
-            "name": "swir1",
-            "title": "Spectral band 5 - Short wave infra-red 1",
-            "abstract": "Short wave infra-red band 1, roughly 1550nm to 1750nm",
-            "components": {
-                "red": {
-                    "swir1": 1.0
-                },
-                "green": {
-                    "swir1": 1.0
-                },
-                "blue": {
-                    "swir1": 1.0
-                }
-            },
-            "scale_factor": 12.0
-        },
-        {
-            "name": "swir2",
-            "title": "Spectral band 6 - Short wave infra-red 2",
-            "abstract": "Short wave infra-red band 2, roughly 2090nm to 2220nm",
-            "components": {
-                "red": {
-                    "swir2": 1.0
-                },
-                "green": {
-                    "swir2": 1.0
-                },
-                "blue": {
-                    "swir2": 1.0
-                }
-            },
-            "scale_factor": 12.0
-        }
-    ],
+    "styles": landsat_7_styles,
     "default_style": "simple_rgb",
 }